@@ -24,7 +24,7 @@ __version__ = "0.1.0"
 # Configuration management
 # Authentication and license handling
 from .auth import Auth
-from .config import Config, get_config, reload_config
+from .config import Config, FrozenConfig, get_config, reload_config
 
 # Network client
 from .network_client import NetworkClient, get_client
@@ -40,6 +40,7 @@ from .roundtrip import (
 __all__ = [
     "Auth",
     "Config",
+    "FrozenConfig",
     "NetworkClient",
     "decrypt_paprika_data",
     "encrypt_paprika_data",
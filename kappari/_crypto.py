@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Shared AES/PBKDF2 primitives for the Paprika data format.
+
+The license decryptor and the round-trip test speak the same wire
+format: PBKDF2-HMAC-SHA1 (1000 iterations) stretches the password into
+a 48-byte block (32-byte AES-256 key followed by a 16-byte IV), and the
+payload is AES-256-CBC with PKCS7 padding. Keeping the primitives here
+guarantees both sides stay in sync and share one key-derivation cache.
+"""
+
+import functools
+import hashlib
+
+# Loaded on first cipher use; importing cryptography pulls in its
+# compiled OpenSSL bindings, which is the slowest import in the
+# package and wasted on callers that never touch the ciphers
+_cipher_primitives = None
+
+
+def _get_cipher_primitives():
+    """Import and cache the cryptography cipher primitives."""
+    global _cipher_primitives
+    if _cipher_primitives is None:
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import (
+            Cipher,
+            algorithms,
+            modes,
+        )
+
+        _cipher_primitives = (Cipher, algorithms, modes, padding.PKCS7)
+    return _cipher_primitives
+
+
+# Paprika's fixed KDF parameters
+PBKDF2_ITERATIONS = 1000
+SALT_SIZE = 32
+KEY_SIZE = 32
+IV_SIZE = 16
+
+
+@functools.lru_cache(maxsize=8)
+def key_bytes(password: str) -> bytes:
+    """UTF-8 encode a password, cached per process.
+
+    The two purchase keys are fixed for a process lifetime, so their
+    encoded forms are memoized instead of re-encoded on every call.
+    """
+    return password.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def derive_key_iv(password: bytes, salt: bytes) -> bytes:
+    """Derive the 48-byte AES key + IV block for a (password, salt) pair.
+
+    The license ciphertext, salt, and password are fixed for a given
+    Paprika install, so the 1000-iteration PBKDF2 output is memoized to
+    make repeat derivations in the same process free. The derivation
+    itself runs in OpenSSL's C implementation via hashlib.
+    """
+    return hashlib.pbkdf2_hmac(
+        "sha1", password, salt, PBKDF2_ITERATIONS, KEY_SIZE + IV_SIZE
+    )
+
+
+def aes_cbc_pbkdf2_encrypt(
+    plaintext: bytes, password: bytes, salt: bytes
+) -> bytes:
+    """Pad (PKCS7) and encrypt a payload keyed by PBKDF2(password, salt).
+
+    Padding and encryption both run inside the OpenSSL-backed
+    primitives, so the block loop never surfaces into Python.
+    """
+    cipher, algorithms, modes, pkcs7 = _get_cipher_primitives()
+    key_iv = derive_key_iv(password, salt)
+    key = key_iv[:KEY_SIZE]
+    iv = key_iv[KEY_SIZE : KEY_SIZE + IV_SIZE]
+
+    padder = pkcs7(128).padder()
+    padded = padder.update(plaintext) + padder.finalize()
+
+    encryptor = cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+    return encryptor.update(padded) + encryptor.finalize()
+
+
+def aes_cbc_pbkdf2_decrypt(
+    ciphertext: bytes, password: bytes, salt: bytes
+) -> bytes:
+    """Decrypt an AES-256-CBC payload keyed by PBKDF2(password, salt).
+
+    Returns the plaintext with PKCS7 padding already stripped; the
+    unpadder validates every padding byte in C and raises ValueError
+    when the padding is invalid (wrong password or corrupt payload).
+    """
+    cipher, algorithms, modes, pkcs7 = _get_cipher_primitives()
+    key_iv = derive_key_iv(password, salt)
+    key = key_iv[:KEY_SIZE]
+    iv = key_iv[KEY_SIZE : KEY_SIZE + IV_SIZE]
+
+    # AES-256-CBC through OpenSSL, which selects the AES-NI pipelined
+    # path where available
+    decryptor = cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+    padded = decryptor.update(ciphertext) + decryptor.finalize()
+
+    unpadder = pkcs7(128).unpadder()
+    return unpadder.update(padded) + unpadder.finalize()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Shared JSON parsing helper.
+
+Prefers orjson's C parser when it is installed and falls back to the
+stdlib, so every caller gets the fast path without repeating the
+optional-import dance per module.
+"""
+
+import json
+
+# Try to use orjson's C parser when available, fall back to stdlib
+try:
+    import orjson
+
+    kappari_orjson_available = True
+except ImportError:
+    kappari_orjson_available = False
+
+
+def loads(data):
+    """Parse JSON, preferring orjson (accepts both str and bytes)."""
+    if kappari_orjson_available:
+        return orjson.loads(data)
+    return json.loads(data)
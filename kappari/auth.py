@@ -4,40 +4,68 @@ Authentication implementation
 """
 
 import base64
+import hashlib
+import hmac
 import json
-import sqlite3
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
-from Crypto.Cipher import AES
-from Crypto.Hash import SHA1
-from Crypto.Protocol.KDF import PBKDF2
-
-from . import log
+from . import _crypto, _json, db, log
 from .config import get_config
 from .network_client import get_client
 
+# Base64 alphabet check used to probe decrypted signatures
+_B64_RE = re.compile(rb"^[A-Za-z0-9+/\r\n]+={0,2}$")
+
+
+@dataclass(frozen=True)
+class License:
+    """Fields parsed out of the decrypted license JSON.
+
+    Parsed once when the license is decrypted, so later steps read
+    plain attributes instead of re-parsing the JSON each time.
+    """
+
+    key: Optional[str] = None
+    product_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, parsed: dict) -> "License":
+        """Build a License from already-parsed license JSON."""
+        return cls(
+            key=parsed.get("key"),
+            product_id=parsed.get("product_id"),
+        )
+
 
 class Auth:
     def __init__(self):
         self.config = get_config()
         self.client = get_client()
         self.license_data = None
+        self.license_json = None
+        self.license_info = None
         self.signature = None
 
     def decrypt_license_data(self):
         """Decrypt license data from SQLite database"""
         log.debug("Starting license data decryption")
 
-        if not Path(self.config.db_file).exists():
+        # Config already stat'ed the database when it resolved the path
+        if not self.config._db_exists:
             log.error("Database not found: %s", self.config.db_file)
             raise Exception(f"Database not found: {self.config.db_file}")
 
         log.debug("Connecting to database: %s", self.config.db_file)
-        conn = sqlite3.connect(self.config.db_file)
-        cursor = conn.cursor()
+        conn = db.get_readonly_connection(self.config.db_file)
 
-        cursor.execute("SELECT product_id, data, signature FROM purchases")
-        row = cursor.fetchone()
+        row = conn.execute(
+            "SELECT product_id, data, signature FROM purchases LIMIT 1"
+        ).fetchone()
 
         if not row:
             log.error("No purchase data found in database")
@@ -46,80 +74,161 @@ class Auth:
         product_id, encrypted_data, encrypted_signature = row
         log.debug("Found purchase data for product: %s", product_id)
 
-        self.license_data = self._decrypt_data(
-            encrypted_data, self.config.purchase_data_key
-        )
-        if self.license_data.startswith("Decryption failed"):
-            log.error("Failed to decrypt license data: %s", self.license_data)
-            raise Exception(
-                f"Failed to decrypt license data: {self.license_data}"
+        # The two blobs decrypt independently, and PBKDF2 releases the
+        # GIL inside OpenSSL, so both key derivations run concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            data_future = pool.submit(
+                self._decrypt_data,
+                encrypted_data,
+                self.config.purchase_data_key,
+            )
+            signature_future = pool.submit(
+                self._decrypt_data,
+                encrypted_signature,
+                self.config.purchase_signature_key,
             )
+            data_raw = data_future.result()
+            signature_raw = signature_future.result()
+
+        if data_raw is None:
+            log.error("Failed to decrypt license data")
+            raise Exception("Failed to decrypt license data")
+
+        if signature_raw is None:
+            log.error("Failed to decrypt signature")
+            raise Exception("Failed to decrypt signature")
 
-        signature_raw = self._decrypt_data(
-            encrypted_signature, self.config.purchase_signature_key
+        # One read-modify-write covers both cache entries; the decrypt
+        # threads themselves never touch the cache file, so they can't
+        # race each other's updates
+        self._store_cached_plaintexts(
+            (
+                (encrypted_data, data_raw),
+                (encrypted_signature, signature_raw),
+            )
         )
-        if signature_raw.startswith("Decryption failed"):
-            log.error("Failed to decrypt signature: %s", signature_raw)
-            raise Exception(f"Failed to decrypt signature: {signature_raw}")
 
-        # Check if the decrypted signature is already Base64 encoded
+        # License data is JSON and needs to be a string for the API;
+        # this is the one place that actually needs the decode
+        self.license_data = data_raw.decode("utf-8")
+        # Parse the JSON once; everything downstream reads the cached
+        # dict or the License attributes
         try:
-            # Try to decode it to see if it's already Base64
-            base64.b64decode(signature_raw)
-            self.signature = signature_raw  # Already Base64 encoded
+            self.license_json = _json.loads(data_raw)
+        except ValueError as e:
+            raise Exception(f"Invalid license data JSON: {e}") from e
+        self.license_info = License.from_dict(self.license_json)
+
+        # Check if the decrypted signature is already Base64 encoded.
+        # A deterministic alphabet check is cheaper than exception
+        # control flow and, unlike b64decode without validate=True,
+        # can't silently accept garbage. The regex allows line breaks
+        # inside the encoding, so the length check must count alphabet
+        # bytes only or multi-line signatures get double-encoded.
+        b64_len = (
+            len(signature_raw)
+            - signature_raw.count(b"\r")
+            - signature_raw.count(b"\n")
+        )
+        if b64_len % 4 == 0 and _B64_RE.match(signature_raw):
+            self.signature = signature_raw.decode("utf-8")
             log.debug("Signature is already Base64 encoded")
-        except Exception:
+        else:
             # If it's not Base64, encode it
-            self.signature = base64.b64encode(
-                signature_raw.encode("utf-8")
-            ).decode("utf-8")
+            self.signature = base64.b64encode(signature_raw).decode("utf-8")
             log.debug("Signature was not Base64 encoded, encoded it")
         log.debug("License data and signature decrypted successfully")
-
-        conn.close()
         return True
 
-    def _decrypt_data(self, encrypted_b64, password):
-        """Decrypt encrypted data"""
+    def _cache_path(self):
+        """Path of the on-disk decrypted license cache."""
+        return self.config.cache_dir / "license.json"
+
+    def _read_cached_plaintext(self, encrypted_b64):
+        """Return cached plaintext bytes for this ciphertext, or None."""
+        if not self.config.cache_enabled:
+            return None
+        cache_path = self._cache_path()
+        if not cache_path.exists():
+            return None
         try:
-            # Decode base64
-            encrypted_data = base64.b64decode(encrypted_b64)
+            cached = _json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        digest = hashlib.sha256(str(encrypted_b64).encode()).hexdigest()
+        for key, value in cached.items():
+            if hmac.compare_digest(key, digest):
+                log.debug("Using cached decrypted data")
+                return base64.b64decode(value)
+        return None
 
-            # First 32 bytes are the salt
-            salt = encrypted_data[:32]
-            ciphertext = encrypted_data[32:]
+    def _store_cached_plaintexts(self, entries):
+        """Persist decrypted plaintexts keyed by ciphertext hash.
 
-            # Use 1000 iterations
-            iterations = 1000
+        Takes (encrypted_b64, plaintext) pairs and folds them into the
+        cache file in a single read-modify-write, skipping the write
+        entirely when nothing changed.
+        """
+        if not self.config.cache_enabled:
+            return
+        cache_path = self._cache_path()
+        try:
+            cached = _json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cached = {}
+        changed = False
+        for encrypted_b64, plaintext in entries:
+            digest = hashlib.sha256(str(encrypted_b64).encode()).hexdigest()
+            encoded = base64.b64encode(plaintext).decode("ascii")
+            if cached.get(digest) != encoded:
+                cached[digest] = encoded
+                changed = True
+        if not changed:
+            return
+        # Write through a temp file and swap it in atomically, like the
+        # .env rewrite does, so a crash can't leave a torn cache
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, delete=False, encoding="utf-8"
+            ) as tmp:
+                tmp.write(json.dumps(cached))
+            Path(tmp.name).replace(cache_path)
+        except OSError as e:
+            log.debug("Could not write license cache: %s", e)
 
-            # Derive key and IV using PBKDF2
-            key_iv = PBKDF2(
-                password.encode("utf-8"),
-                salt,
-                48,
-                count=iterations,
-                hmac_hash_module=SHA1,
-            )
-            key = key_iv[:32]  # 256-bit AES key
-            iv = key_iv[32:48]  # 128-bit IV
+    def _decrypt_data(self, encrypted_b64, password):
+        """Decrypt encrypted data.
 
-            # Decrypt with AES-256-CBC
-            cipher = AES.new(key, AES.MODE_CBC, iv)
-            decrypted_padded = cipher.decrypt(ciphertext)
+        Returns the plaintext as bytes, or None if decryption fails.
+        Callers decide if and where a str is actually needed, so the
+        signature path avoids a decode/re-encode round trip.
+        """
+        cached = self._read_cached_plaintext(encrypted_b64)
+        if cached is not None:
+            return cached
 
-            # Remove PKCS7 padding
-            padding_len = decrypted_padded[-1]
-            if 1 <= padding_len <= 16:
-                # Verify padding is correct
-                padding_bytes = decrypted_padded[-padding_len:]
-                if all(b == padding_len for b in padding_bytes):
-                    decrypted = decrypted_padded[:-padding_len]
-                    return decrypted.decode("utf-8")
+        try:
+            # Decode base64
+            encrypted_data = base64.b64decode(encrypted_b64)
+
+            # First 32 bytes are the salt. Slicing through a
+            # memoryview keeps the ciphertext as a zero-copy view of
+            # the decoded buffer; only the small salt is materialized,
+            # since the memoized KDF needs a hashable key.
+            mv = memoryview(encrypted_data)
+            salt = bytes(mv[: _crypto.SALT_SIZE])
+            ciphertext = mv[_crypto.SALT_SIZE :]
 
-            return "Decryption failed: Invalid padding"
+            # Decryption and PKCS7 padding validation both happen in
+            # OpenSSL; a wrong password or corrupt payload surfaces as
+            # ValueError from the unpadder and is caught below
+            return _crypto.aes_cbc_pbkdf2_decrypt(
+                ciphertext, _crypto.key_bytes(password), salt
+            )
 
         except Exception as e:
-            return f"Decryption failed: {e}"
+            log.debug("Decryption failed: %s", e)
+            return None
 
     def authenticate(self, email, password):
         """Authenticate with server and get JWT token"""
@@ -129,15 +238,9 @@ class Auth:
                 "Call decrypt_license_data() first."
             )
 
-        # The license data needs to be sent as JSON
-        try:
-            license_json = json.loads(self.license_data)
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid license data JSON: {e}") from e
-
         log.info("Attempting to authenticate with email: %s", email)
-        log.debug("License key: %s", license_json.get("key", "N/A"))
-        log.debug("Product ID: %s", license_json.get("product_id", "N/A"))
+        log.debug("License key: %s", self.license_info.key or "N/A")
+        log.debug("Product ID: %s", self.license_info.product_id or "N/A")
 
         # Use the network client for authentication
         jwt_token = self.client.authenticate(
@@ -4,59 +4,338 @@ Configuration Module
 Loads configuration from environment variables with sensible defaults
 """
 
+import functools
 import os
-import sqlite3
 import sys
+import tempfile
+import threading
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from . import db, log
+
+# Truthy values accepted by boolean environment variables
+_TRUE = frozenset(("true", "yes", "1", "on", "y", "t"))
+
+# Project root (the checkout containing the .env file and the bundled
+# capture database), resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_ENV_FILE = _PROJECT_ROOT / ".env"
+
+# Whether the .env file has been merged into os.environ yet, plus the
+# keys it supplied, so a forced reload can overwrite exactly those
+_env_file_loaded = False
+_env_file_keys: set = set()
+
+
+def _load_env_file(force: bool = False) -> None:
+    """Merge KEY=VALUE pairs from the .env file into os.environ, once.
+
+    The simple format used here needs nothing more than a single-pass
+    split per line, which avoids python-dotenv's parsing machinery and
+    defers the file read from module import to first Config use. The
+    parse result is cached for the process, so constructing more Config
+    objects costs no file I/O; reload_config() passes force=True to
+    re-read the file and overwrite the values an earlier load supplied.
+    Variables set in the real environment always win.
+    """
+    global _env_file_loaded
+    if _env_file_loaded and not force:
+        return
+    _env_file_loaded = True
+
+    if not _ENV_FILE.is_file():
+        return
+    for raw_line in _ENV_FILE.read_bytes().splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(b"#") or b"=" not in line:
+            continue
+        raw_key, _, raw_value = line.partition(b"=")
+        key = raw_key.decode().strip()
+        # Only file-sourced keys may be overwritten on reload; a key
+        # already present from the real environment stays untouched
+        if key in os.environ and key not in _env_file_keys:
+            continue
+        os.environ[key] = raw_value.decode().strip().strip('"')
+        _env_file_keys.add(key)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse boolean from string"""
+    return value.strip().lower() in _TRUE
+
+
+def _env_int(key: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default."""
+    value = os.getenv(key)
+    return int(value) if value else default
+
+
+# Directories already created (or verified) by this process, so repeated
+# Config constructions don't re-issue mkdir syscalls for the same paths
+_created_dirs = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory if this process hasn't already done so."""
+    if path in _created_dirs:
+        return
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
+def _platform_default_root() -> Optional[Path]:
+    """Platform-specific default Paprika installation directory."""
+    if sys.platform == "win32":
+        localappdata = os.environ.get("LOCALAPPDATA")
+        if localappdata:
+            return Path(localappdata) / "Paprika Recipe Manager 3"
+    elif sys.platform == "darwin":
+        return (
+            Path.home()
+            / "Library"
+            / "Application Support"
+            / "Paprika Recipe Manager 3"
+        )
+    # No default for Linux - user must specify
+    return None
+
+
+def _platform_db_candidates() -> Tuple[Path, ...]:
+    """Default Paprika database locations to probe on this platform."""
+    home = Path.home()
+    candidates = []
+
+    if sys.platform == "win32":
+        appdata = os.environ.get("APPDATA")
+        if appdata:
+            candidates.append(
+                Path(appdata) / "Paprika Recipe Manager 3" / "Paprika.sqlite"
+            )
+    elif sys.platform == "darwin":
+        candidates.append(
+            home
+            / "Library"
+            / "Application Support"
+            / "Paprika Recipe Manager 3"
+            / "Paprika.sqlite"
+        )
+    elif sys.platform.startswith("linux"):
+        # Might be in .config or .local/share
+        candidates.extend(
+            [
+                home
+                / ".config"
+                / "Paprika Recipe Manager 3"
+                / "Paprika.sqlite",
+                home
+                / ".local"
+                / "share"
+                / "Paprika Recipe Manager 3"
+                / "Paprika.sqlite",
+            ]
+        )
+
+    # A local database in the captures directory works everywhere
+    candidates.append(_PROJECT_ROOT / "database" / "Paprika.sqlite")
+    return tuple(candidates)
+
 
-from dotenv import load_dotenv
+# sys.platform and the relevant environment variables are fixed for the
+# process lifetime, so resolve the platform defaults once at import
+# instead of re-branching on every Config construction.
+_DEFAULT_ROOT = _platform_default_root()
+_DEFAULT_DB_CANDIDATES = _platform_db_candidates()
 
-from . import log
 
-# Load .env file using default approach
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _find_default_db_path() -> Optional[str]:
+    """Find the default Paprika database path for this OS, if any.
+
+    Confirms each candidate with one readdir of its parent directory
+    instead of stat'ing the full path, which is cheaper on cold network
+    mounts, and caches the answer for the process so config reloads
+    don't repeat the probe. A missing or unreadable parent simply rules
+    the candidate out.
+    """
+    for candidate in _DEFAULT_DB_CANDIDATES:
+        try:
+            with os.scandir(candidate.parent) as entries:
+                found = any(e.name == candidate.name for e in entries)
+        except OSError:
+            continue
+        if found:
+            return str(candidate)
+    return None
+
+
+# Configuration sections and the attributes each one provides. Sections
+# are initialized lazily on first attribute access so that callers which
+# only need a couple of settings (e.g. db_file and the purchase keys)
+# don't pay for directory creation or database probing.
+_CONFIG_SECTIONS = {
+    "_setup_credentials": ("email", "password"),
+    "_setup_root_directory": ("root_dir", "_resolve_path"),
+    "_setup_database": ("db_file", "db_backup_dir", "_db_path", "_db_exists"),
+    "_setup_api_config": ("api_base_url", "user_agent", "api_timeout"),
+    "_setup_license_auth": (
+        "device_id",
+        "jwt_token",
+        "purchase_data_key",
+        "purchase_signature_key",
+    ),
+    "_setup_sync_config": ("sync_enabled", "sync_interval", "websocket_url"),
+    "_setup_paths": ("_export_dir", "_import_dir", "export_format"),
+    "_setup_logging": (
+        "log_level",
+        "_log_dir",
+        "debug_api_requests",
+        "debug_sql_queries",
+        "pretty_json",
+    ),
+    "_setup_network": ("http_proxy", "https_proxy", "verify_ssl", "proxies"),
+    "_setup_cache_and_storage": (
+        "cache_enabled",
+        "_cache_dir",
+        "cache_ttl",
+        "_recipes_local_dir",
+        "store_photos_locally",
+        "_photos_dir",
+    ),
+    "_setup_development": (
+        "dry_run",
+        "use_mock_data",
+        "_mock_data_dir",
+        "persist_tokens",
+    ),
+}
+
+# Reverse map: attribute name -> section that provides it
+_ATTR_SECTION = {
+    attr: section
+    for section, attrs in _CONFIG_SECTIONS.items()
+    for attr in attrs
+}
+
+# Directory attributes whose mkdir is deferred until the directory is
+# actually requested: public name -> (attribute holding the Path, gate
+# attribute that must be truthy for the directory to be created).
+_LAZY_DIRS = {
+    "export_dir": ("_export_dir", None),
+    "import_dir": ("_import_dir", None),
+    "log_dir": ("_log_dir", None),
+    "cache_dir": ("_cache_dir", "cache_enabled"),
+    "recipes_local_dir": ("_recipes_local_dir", None),
+    "photos_dir": ("_photos_dir", "store_photos_locally"),
+    "mock_data_dir": ("_mock_data_dir", "use_mock_data"),
+}
+
+
+@dataclass(frozen=True)
+class FrozenConfig:
+    """Immutable snapshot of the settings worker processes need.
+
+    Built once by Config.freeze() in the parent and handed to child
+    processes (e.g. via a ProcessPoolExecutor initializer), so each
+    worker skips .env parsing and config setup entirely. Picklable by
+    construction.
+    """
+
+    email: Optional[str]
+    password: Optional[str]
+    db_file: str
+    api_base_url: str
+    user_agent: str
+    api_timeout: int
+    device_id: Optional[str]
+    jwt_token: Optional[str]
+    purchase_data_key: str
+    purchase_signature_key: str
+    sync_enabled: bool
+    sync_interval: int
+    websocket_url: str
+    verify_ssl: bool
+    proxies: Dict[str, str]
+
+
+# Attribute names snapshotted by Config.freeze()
+_FROZEN_FIELDS = tuple(f.name for f in fields(FrozenConfig))
 
 
 class Config:
-    """Configuration class for Paprika API client"""
+    """Configuration class for Paprika API client.
+
+    Sections are populated on demand: touching any attribute runs only
+    the setup method that provides it (plus whatever sections that
+    method itself needs), so unused sections never run.
+    """
 
     def __init__(self):
-        self._setup_credentials()
-        self._setup_root_directory()
-        self._setup_database()
-        self._setup_api_config()
-        self._setup_license_auth()
-        self._setup_sync_config()
-        self._setup_paths()
-        self._setup_logging()
-        self._setup_network()
-        self._setup_cache_and_storage()
-        self._setup_development()
+        _load_env_file()
+        self._loaded_sections = set()
+        # RLock, not Lock: sections load other sections recursively
+        # (credentials -> database -> root directory)
+        self._section_lock = threading.RLock()
+        self._cached_headers = None
+
+    def __getattr__(self, name):
+        lazy_dir = _LAZY_DIRS.get(name)
+        if lazy_dir is not None:
+            private_attr, gate = lazy_dir
+            path = getattr(self, private_attr)
+            if gate is None or getattr(self, gate):
+                _ensure_dir(path)
+            # Cache under the public name so later reads skip this hook
+            self.__dict__[name] = path
+            return path
+        section = _ATTR_SECTION.get(name)
+        if section is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        self._load_section(section)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def _load_section(self, section: str) -> None:
+        """Run a _setup_* method once, on first demand.
+
+        Serialized under a lock, and the section is marked loaded only
+        after its setup method returns: the auth pool threads demand
+        the same section concurrently, and a thread seeing the mark
+        early would read a half-initialized config.
+        """
+        if section in self._loaded_sections:
+            return
+        with self._section_lock:
+            if section in self._loaded_sections:
+                return
+            object.__getattribute__(self, section)()
+            self._loaded_sections.add(section)
 
     def _setup_credentials(self):
         """Setup user credentials configuration."""
         self.email = os.getenv("KAPPARI_EMAIL")
         self.password = os.getenv("KAPPARI_PASSWORD")
 
-        # If no email in env, we'll try to get it from database later
-        self._try_load_email_from_db = not self.email
+        # If no email in env, try to get it from the database
+        if not self.email:
+            try:
+                db_exists = self._db_exists
+            except ValueError:
+                db_exists = False
+            if db_exists:
+                self._load_email_from_database()
 
     def _get_platform_default_root(self) -> Optional[Path]:
         """Get platform-specific default Paprika installation directory."""
-        if sys.platform == "win32":
-            localappdata = os.environ.get("LOCALAPPDATA")
-            if localappdata:
-                return Path(localappdata) / "Paprika Recipe Manager 3"
-        elif sys.platform == "darwin":
-            return (
-                Path.home()
-                / "Library"
-                / "Application Support"
-                / "Paprika Recipe Manager 3"
-            )
-        # No default for Linux - user must specify
-        return None
+        return _DEFAULT_ROOT
 
     def _setup_root_directory(self):
         """Setup root directory for Paprika installation."""
@@ -75,59 +354,78 @@ class Config:
                 self.root_dir = None
                 log.info("No root directory set, using individual path config")
 
-    def _resolve_path(
-        self,
-        env_key: str,
-        default_relative_path: str,
-        fallback_absolute: Optional[str] = None,
-    ) -> Optional[str]:
-        """
-        Resolve path using root directory + override logic.
+        self._resolve_path = self._make_resolver()
 
-        Args:
-            env_key: Environment variable name to check
-            default_relative_path: Default path relative to root_dir
-            fallback_absolute: Fallback when no root_dir available
+    def _make_resolver(self):
+        """
+        Build the path resolver for the current root_dir.
 
-        Returns:
-            Resolved path as string, or None if cannot resolve
+        The resolver takes (env_key, default_relative_path,
+        fallback_absolute) and returns the resolved path as a string, or
+        None if it cannot resolve. The root_dir branch is decided once
+        here rather than on every resolve call, so each closure only
+        handles its own case.
         """
-        specific_path = os.getenv(env_key)
-
-        if specific_path:
-            if Path(specific_path).is_absolute():
-                return specific_path  # Absolute override
-            if self.root_dir:
-                return str(self.root_dir / specific_path)  # Relative to root
-            # No root dir but user provided relative path - problematic
-            raise ValueError(
-                f"{env_key} is relative but KAPPARI_ROOT_DIR not set"
-            )
-        if self.root_dir:
-            return str(self.root_dir / default_relative_path)  # Default
-        return fallback_absolute  # Fallback to old behavior
+        root_dir = self.root_dir
+
+        if root_dir:
+
+            def resolve(
+                env_key: str,
+                default_relative_path: str,
+                _fallback_absolute: Optional[str] = None,
+            ) -> Optional[str]:
+                specific_path = os.getenv(env_key)
+                if specific_path:
+                    if Path(specific_path).is_absolute():
+                        return specific_path  # Absolute override
+                    return str(root_dir / specific_path)  # Relative to root
+                return str(root_dir / default_relative_path)  # Default
+
+            return resolve
+
+        def resolve(
+            env_key: str,
+            _default_relative_path: str,
+            fallback_absolute: Optional[str] = None,
+        ) -> Optional[str]:
+            specific_path = os.getenv(env_key)
+            if specific_path:
+                if Path(specific_path).is_absolute():
+                    return specific_path  # Absolute override
+                # No root dir but user provided relative path - problematic
+                raise ValueError(
+                    f"{env_key} is relative but KAPPARI_ROOT_DIR not set"
+                )
+            return fallback_absolute  # Fallback to old behavior
+
+        return resolve
 
     def _setup_database(self):
         """Setup database configuration."""
-        self.db_file = self._resolve_path(
+        db_file = self._resolve_path(
             "KAPPARI_DB_FILE",
             "Database/Paprika.sqlite",
-            self._find_default_db_path(),  # Fallback to old logic
-        )
-        self.db_backup_dir = self._resolve_path(
-            "KAPPARI_DB_BACKUP_DIR", "Database/Backups", None
+            _find_default_db_path(),  # Fallback to old logic
         )
 
-        # Validate required fields
-        if not self.db_file:
+        # Validate before assigning so a failed load leaves no partial
+        # state behind
+        if not db_file:
             raise ValueError(
                 "Database file could not be determined. "
                 "Set KAPPARI_ROOT_DIR or KAPPARI_DB_FILE in your .env file"
             )
 
-        # Try to load email from database if not in env
-        if self._try_load_email_from_db and Path(self.db_file).exists():
-            self._load_email_from_database()
+        self.db_file = db_file
+        self.db_backup_dir = self._resolve_path(
+            "KAPPARI_DB_BACKUP_DIR", "Database/Backups", None
+        )
+
+        # Cache the existence check so downstream callers don't each
+        # pay another stat syscall
+        self._db_path = Path(db_file)
+        self._db_exists = self._db_path.exists()
 
     def _setup_api_config(self):
         """Setup API configuration."""
@@ -140,7 +438,7 @@ class Config:
             "Paprika Recipe Manager 3/3.3.1 "
             "(Microsoft Windows NT 10.0.26100.0)",
         )
-        self.api_timeout = int(os.getenv("KAPPARI_API_TIMEOUT", "30"))
+        self.api_timeout = _env_int("KAPPARI_API_TIMEOUT", 30)
 
     def _setup_license_auth(self):
         """Setup license and authentication configuration."""
@@ -159,10 +457,10 @@ class Config:
     def _setup_sync_config(self):
         """Setup sync configuration."""
 
-        self.sync_enabled = self._parse_bool(
+        self.sync_enabled = _parse_bool(
             os.getenv("KAPPARI_SYNC_ENABLED", "true")
         )
-        self.sync_interval = int(os.getenv("KAPPARI_SYNC_INTERVAL", "15"))
+        self.sync_interval = _env_int("KAPPARI_SYNC_INTERVAL", 15)
         self.websocket_url = os.getenv(
             "KAPPARI_WEBSOCKET_URL", "wss://www.paprikaapp.com/ws/sync/"
         )
@@ -175,109 +473,87 @@ class Config:
         import_dir_str = self._resolve_path(
             "KAPPARI_IMPORT_DIR", "imports", "./imports"
         )
-        self.export_dir = Path(export_dir_str)
-        self.import_dir = Path(import_dir_str)
+        self._export_dir = Path(export_dir_str)
+        self._import_dir = Path(import_dir_str)
         self.export_format = os.getenv("KAPPARI_EXPORT_FORMAT", "json")
 
-        # Create directories if they don't exist
-        self.export_dir.mkdir(parents=True, exist_ok=True)
-        self.import_dir.mkdir(parents=True, exist_ok=True)
-
     def _setup_logging(self):
         """Setup logging configuration."""
 
         self.log_level = os.getenv("KAPPARI_LOG_LEVEL", "INFO")
         log_dir_str = self._resolve_path("KAPPARI_LOG_DIR", "Logs", "./logs")
-        self.log_dir = Path(log_dir_str)
-        self.debug_api_requests = self._parse_bool(
+        self._log_dir = Path(log_dir_str)
+        self.debug_api_requests = _parse_bool(
             os.getenv("KAPPARI_DEBUG_API_REQUESTS", "false")
         )
-        self.debug_sql_queries = self._parse_bool(
+        self.debug_sql_queries = _parse_bool(
             os.getenv("KAPPARI_DEBUG_SQL_QUERIES", "false")
         )
-        self.pretty_json = self._parse_bool(
+        self.pretty_json = _parse_bool(
             os.getenv("KAPPARI_PRETTY_JSON", "true")
         )
 
-        # Create log directory if it doesn't exist
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-
     def _setup_network(self):
         """Setup network configuration."""
 
         self.http_proxy = os.getenv("KAPPARI_HTTP_PROXY")
         self.https_proxy = os.getenv("KAPPARI_HTTPS_PROXY")
-        self.verify_ssl = self._parse_bool(
-            os.getenv("KAPPARI_VERIFY_SSL", "true")
-        )
+        self.verify_ssl = _parse_bool(os.getenv("KAPPARI_VERIFY_SSL", "true"))
 
         # Build proxy dict for requests
-        self.proxies = {}
-        if self.http_proxy:
-            self.proxies["http"] = self.http_proxy
-        if self.https_proxy:
-            self.proxies["https"] = self.https_proxy
+        self.proxies = {
+            scheme: proxy
+            for scheme, proxy in (
+                ("http", self.http_proxy),
+                ("https", self.https_proxy),
+            )
+            if proxy
+        }
 
     def _setup_cache_and_storage(self):
         """Setup cache and storage configuration."""
 
         # Cache settings
-        self.cache_enabled = self._parse_bool(
+        self.cache_enabled = _parse_bool(
             os.getenv("KAPPARI_CACHE_ENABLED", "true")
         )
         cache_dir_str = self._resolve_path(
             "KAPPARI_CACHE_DIR", "cache", "./cache"
         )
-        self.cache_dir = Path(cache_dir_str)
-        self.cache_ttl = int(os.getenv("KAPPARI_CACHE_TTL", "3600"))
-
-        # Create cache directory if enabled
-        if self.cache_enabled:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = Path(cache_dir_str)
+        self.cache_ttl = _env_int("KAPPARI_CACHE_TTL", 3600)
 
         # Recipe storage
         recipes_dir_str = self._resolve_path(
             "KAPPARI_RECIPES_LOCAL_DIR", "recipes", "./recipes"
         )
-        self.recipes_local_dir = Path(recipes_dir_str)
-        self.store_photos_locally = self._parse_bool(
+        self._recipes_local_dir = Path(recipes_dir_str)
+        self.store_photos_locally = _parse_bool(
             os.getenv("KAPPARI_STORE_PHOTOS_LOCALLY", "true")
         )
         photos_dir_str = self._resolve_path(
             "KAPPARI_PHOTOS_DIR", "Photos", "./photos"
         )
-        self.photos_dir = Path(photos_dir_str)
-
-        # Create recipe and photo directories
-        self.recipes_local_dir.mkdir(parents=True, exist_ok=True)
-        if self.store_photos_locally:
-            self.photos_dir.mkdir(parents=True, exist_ok=True)
+        self._photos_dir = Path(photos_dir_str)
 
     def _setup_development(self):
         """Setup development and testing configuration."""
 
-        self.dry_run = self._parse_bool(os.getenv("KAPPARI_DRY_RUN", "false"))
-        self.use_mock_data = self._parse_bool(
+        self.dry_run = _parse_bool(os.getenv("KAPPARI_DRY_RUN", "false"))
+        self.use_mock_data = _parse_bool(
             os.getenv("KAPPARI_USE_MOCK_DATA", "false")
         )
-        self.mock_data_dir = Path(
+        self._mock_data_dir = Path(
             os.getenv("KAPPARI_MOCK_DATA_DIR", "./test/mock_data")
         )
-        self.persist_tokens = self._parse_bool(
+        self.persist_tokens = _parse_bool(
             os.getenv("KAPPARI_PERSIST_TOKENS", "false")
         )
 
-        if self.use_mock_data:
-            self.mock_data_dir.mkdir(parents=True, exist_ok=True)
-
-    def _parse_bool(self, value: str) -> bool:
-        """Parse boolean from string"""
-        return value.lower() in ("true", "yes", "1", "on")
-
     def _load_email_from_database(self):
         """Try to load email from Paprika database settings."""
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = db.get_readonly_connection(self.db_file)
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT value FROM settings WHERE name = 'SyncEmail'"
@@ -288,64 +564,18 @@ class Config:
                 email = row[0].strip('"')
                 self.email = email
                 log.info("Loaded email from database: %s", email)
-            conn.close()
         except Exception as e:
             log.debug("Could not load email from database: %s", e)
 
-    def _find_default_db_path(self) -> Optional[str]:
-        """Try to find the default Paprika database path based on OS"""
-        home = Path.home()
-
-        # Check Windows paths
-        if sys.platform == "win32":
-            appdata = os.environ.get("APPDATA")
-            if appdata:
-                win_path = (
-                    Path(appdata)
-                    / "Paprika Recipe Manager 3"
-                    / "Paprika.sqlite"
-                )
-                if win_path.exists():
-                    return str(win_path)
-
-        # Check macOS path
-        elif sys.platform == "darwin":
-            mac_path = (
-                home
-                / "Library"
-                / "Application Support"
-                / "Paprika Recipe Manager 3"
-                / "Paprika.sqlite"
-            )
-            if mac_path.exists():
-                return str(mac_path)
+    def freeze(self) -> FrozenConfig:
+        """Snapshot the current settings into a FrozenConfig.
 
-        # Check Linux path (might be in .config or .local/share)
-        elif sys.platform.startswith("linux"):
-            # Try common Linux paths
-            paths_to_check = [
-                home
-                / ".config"
-                / "Paprika Recipe Manager 3"
-                / "Paprika.sqlite",
-                home
-                / ".local"
-                / "share"
-                / "Paprika Recipe Manager 3"
-                / "Paprika.sqlite",
-            ]
-            for linux_path in paths_to_check:
-                if linux_path.exists():
-                    return str(linux_path)
-
-        # Check if there's a local database in the captures directory
-        local_test_db = (
-            Path(__file__).parent.parent / "database" / "Paprika.sqlite"
+        slots=True would trim the snapshot further but needs Python
+        3.10; the project still supports 3.8.
+        """
+        return FrozenConfig(
+            **{name: getattr(self, name) for name in _FROZEN_FIELDS}
         )
-        if local_test_db.exists():
-            return str(local_test_db)
-
-        return None
 
     def validate_credentials(self) -> bool:
         """Check if we have the minimum required credentials"""
@@ -353,18 +583,28 @@ class Config:
 
     def get_request_headers(self) -> dict:
         """Get headers for API requests"""
-        headers = {
-            "User-Agent": self.user_agent,
-        }
+        # Build once and reuse; update_jwt_token invalidates. Hand out
+        # a copy so callers can add per-request headers freely.
+        if self._cached_headers is None:
+            headers = {
+                "User-Agent": self.user_agent,
+            }
 
-        if self.jwt_token:
-            headers["Authorization"] = f"Bearer {self.jwt_token}"
+            if self.jwt_token:
+                headers["Authorization"] = f"Bearer {self.jwt_token}"
 
-        return headers
+            self._cached_headers = headers
+
+        return self._cached_headers.copy()
 
     def update_jwt_token(self, token: str):
         """Update JWT token in memory and optionally save to .env file"""
+        # Make sure the license/auth section is populated first so a
+        # later lazy load doesn't clobber the new token with the env
+        # value.
+        self._load_section("_setup_license_auth")
         self.jwt_token = token
+        self._cached_headers = None
 
         # Optionally write back to .env file if configured to persist tokens
         if self.persist_tokens:
@@ -372,35 +612,62 @@ class Config:
 
     def _update_env_file(self, key: str, value: str):
         """Update a value in the .env file"""
-        env_file = Path(__file__).parent.parent / ".env"
+        env_file = _ENV_FILE
         if not env_file.exists():
             return
 
-        lines = env_file.read_text().splitlines()
+        prefix = f"{key}=".encode()
+        replacement = f"{key}={value}\n".encode()
         updated = False
-
-        for i, line in enumerate(lines):
-            if line.startswith(f"{key}="):
-                lines[i] = f"{key}={value}"
-                updated = True
-                break
-
-        if not updated:
-            lines.append(f"{key}={value}")
-
-        env_file.write_text("\n".join(lines) + "\n")
+        last_line = b"\n"
+
+        # Stream through a temp file in the same directory and swap it
+        # in atomically, so a crash mid-write can't truncate the .env
+        with env_file.open("rb") as src, tempfile.NamedTemporaryFile(
+            dir=env_file.parent, delete=False
+        ) as tmp:
+            for line in src:
+                if not updated and line.startswith(prefix):
+                    tmp.write(replacement)
+                    updated = True
+                else:
+                    tmp.write(line)
+                    last_line = line
+            if not updated:
+                # A file without a final newline would otherwise merge
+                # its last setting into the appended one
+                if not last_line.endswith(b"\n"):
+                    tmp.write(b"\n")
+                tmp.write(replacement)
+
+        # NamedTemporaryFile creates 0600 files; carry the .env's
+        # existing permissions across the swap
+        tmp_path = Path(tmp.name)
+        tmp_path.chmod(env_file.stat().st_mode & 0o7777)
+        tmp_path.replace(env_file)
+
+    # Template interned once at class creation; __repr__ only fills in
+    # the values
+    _REPR_TMPL = (
+        "Config(\n"
+        "  email={email},\n"
+        "  db_file={db_file},\n"
+        "  api_base_url={api_base_url},\n"
+        "  sync_enabled={sync_enabled},\n"
+        "  cache_enabled={cache_enabled},\n"
+        "  dry_run={dry_run}\n"
+        ")"
+    )
 
     def __repr__(self) -> str:
         """String representation of config"""
-        return (
-            f"Config(\n"
-            f"  email={self.email if self.email else 'NOT SET'},\n"
-            f"  db_file={self.db_file},\n"
-            f"  api_base_url={self.api_base_url},\n"
-            f"  sync_enabled={self.sync_enabled},\n"
-            f"  cache_enabled={self.cache_enabled},\n"
-            f"  dry_run={self.dry_run}\n"
-            f")"
+        return self._REPR_TMPL.format(
+            email=self.email if self.email else "NOT SET",
+            db_file=self.db_file,
+            api_base_url=self.api_base_url,
+            sync_enabled=self.sync_enabled,
+            cache_enabled=self.cache_enabled,
+            dry_run=self.dry_run,
         )
 
 
@@ -409,18 +676,23 @@ class _ConfigSingleton:
     """Config singleton holder."""
 
     _instance: Optional[Config] = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> Config:
         """Get the singleton config instance."""
         if cls._instance is None:
-            cls._instance = Config()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = Config()
         return cls._instance
 
     @classmethod
     def reload_instance(cls) -> Config:
         """Reload configuration from environment."""
-        cls._instance = Config()
+        with cls._lock:
+            _load_env_file(force=True)
+            cls._instance = Config()
         return cls._instance
 
 
@@ -433,3 +705,11 @@ def get_config() -> Config:
 def reload_config() -> Config:
     """Reload configuration from environment"""
     return _ConfigSingleton.reload_instance()
+
+
+def __getattr__(name):
+    # Support `from kappari.config import config` without constructing
+    # the Config eagerly at import time.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
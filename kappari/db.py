@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite access helpers.
+
+Opens one read-only connection per database file and reuses it for the
+lifetime of the process, so repeated auth cycles don't pay connection
+setup and schema parsing on every call. Read-only mode also lets SQLite
+skip journal/WAL setup entirely.
+"""
+
+import atexit
+import contextlib
+import sqlite3
+from typing import Dict
+
+from . import log
+
+# One cached connection per database path, kept open for the process
+# lifetime and closed at interpreter exit.
+_connections: Dict[str, sqlite3.Connection] = {}
+
+
+def _close_all() -> None:
+    """Close all cached connections at interpreter exit."""
+    for conn in _connections.values():
+        with contextlib.suppress(sqlite3.Error):
+            conn.close()
+    _connections.clear()
+
+
+atexit.register(_close_all)
+
+
+def get_readonly_connection(db_path: str) -> sqlite3.Connection:
+    """Get a cached read-only connection for a database file."""
+    conn = _connections.get(db_path)
+    if conn is None:
+        log.debug("Opening read-only connection to %s", db_path)
+        conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        # Guard against accidental writes and let SQLite serve pages
+        # (including the purchase BLOBs) from a mapped file instead of
+        # copying them through a heap cache
+        conn.execute("PRAGMA query_only = 1")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        _connections[db_path] = conn
+    return conn
@@ -3,20 +3,23 @@
 Clean logging interface.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 # Global flag to ensure initialization happens only once
 kappari_logging_initialized = False
 
+# Root logger, cached so the helpers skip the getLogger lookup and the
+# module-level logging.* wrappers on every call
+_root = logging.getLogger()
+
 
 def _setup_logging() -> None:
     """Internal function to set up logging configuration."""
@@ -24,6 +27,9 @@ def _setup_logging() -> None:
     if kappari_logging_initialized:
         return
 
+    # Load .env on first use rather than at import
+    load_dotenv()
+
     # Get configuration from environment
     log_level = os.getenv("KAPPARI_LOG_LEVEL", "INFO")
     log_path = Path(os.getenv("KAPPARI_LOG_DIR", "./logs"))
@@ -31,10 +37,14 @@ def _setup_logging() -> None:
     # Create log directory
     log_path.mkdir(parents=True, exist_ok=True)
 
+    # Resolve the level name once for both the root logger and the
+    # console handler
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
     # Clear any existing handlers
-    root_logger = logging.getLogger()
+    root_logger = _root
     root_logger.handlers.clear()
-    root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    root_logger.setLevel(level)
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -51,8 +61,7 @@ def _setup_logging() -> None:
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(simple_formatter)
-    console_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(level)
 
     # Main log with rotation
     main_log = log_path / "main.log"
@@ -60,7 +69,6 @@ def _setup_logging() -> None:
         main_log, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
     )
     main_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(main_handler)
 
     # Error log
     error_log = log_path / "errors.log"
@@ -69,7 +77,20 @@ def _setup_logging() -> None:
     )
     error_handler.setFormatter(detailed_formatter)
     error_handler.setLevel(logging.ERROR)
-    root_logger.addHandler(error_handler)
+
+    # Formatting and file/console I/O run on a background listener
+    # thread; the calling thread only enqueues the record
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        main_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
     # Quiet third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -82,34 +103,49 @@ def _setup_logging() -> None:
 # modules should use
 
 
+def is_debug_enabled() -> bool:
+    """Whether DEBUG records would actually be emitted.
+
+    Lets callers skip building expensive log arguments when the level
+    filter would discard them anyway.
+    """
+    _setup_logging()
+    return _root.isEnabledFor(logging.DEBUG)
+
+
 def debug(msg: str, *args) -> None:
     """Log a debug message."""
     _setup_logging()
-    logging.debug(msg, *args)
+    if _root.isEnabledFor(logging.DEBUG):
+        _root.debug(msg, *args)
 
 
 def info(msg: str, *args) -> None:
     """Log an info message."""
     _setup_logging()
-    logging.info(msg, *args)
+    if _root.isEnabledFor(logging.INFO):
+        _root.info(msg, *args)
 
 
 def warning(msg: str, *args) -> None:
     """Log a warning message."""
     _setup_logging()
-    logging.warning(msg, *args)
+    if _root.isEnabledFor(logging.WARNING):
+        _root.warning(msg, *args)
 
 
 def error(msg: str, *args) -> None:
     """Log an error message."""
     _setup_logging()
-    logging.error(msg, *args)
+    if _root.isEnabledFor(logging.ERROR):
+        _root.error(msg, *args)
 
 
 def critical(msg: str, *args) -> None:
     """Log a critical message."""
     _setup_logging()
-    logging.critical(msg, *args)
+    if _root.isEnabledFor(logging.CRITICAL):
+        _root.critical(msg, *args)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,10 @@ Handles all HTTP requests with dry run support and proper logging.
 """
 
 import json
-import uuid
+import secrets
 from typing import Any, Dict, Optional
 
-from . import log
+from . import _json, log
 from .config import get_config
 
 # Try to import requests, but handle if not available
@@ -22,18 +22,58 @@ except ImportError:
     log.warning("requests library not available. Network features disabled.")
 
 
+class _LazyJson:
+    """Defer json.dumps until the log record is actually emitted.
+
+    Passed as a %s argument to log.debug, so the serialization only
+    happens when the DEBUG level is enabled and the record is
+    formatted.
+    """
+
+    def __init__(self, obj, pretty: bool):
+        self.obj = obj
+        self.pretty = pretty
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj, indent=2 if self.pretty else None)
+
+
 class NetworkClient:
     """HTTP client for Paprika API with dry run support."""
 
     def __init__(self):
         self.config = get_config()
+        self._session = None
+        self._default_headers = None
+
+    def _get_session(self):
+        """Get the shared requests session, creating it on first use.
+
+        One session for the client's lifetime keeps the connection pool
+        and TLS sessions alive, so follow-up requests skip the TCP and
+        TLS handshakes.
+        """
+        if self._session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=16, pool_maxsize=32
+                ),
+            )
+            self._session = session
+        return self._session
 
     def _log_prepared_request(self, prepared):
         """Log the prepared request from requests library."""
+        if not log.is_debug_enabled():
+            return
         log.debug("=== PREPARED REQUEST ===")
         log.debug("Method: %s", prepared.method)
         log.debug("URL: %s", prepared.url)
-        log.debug("Headers: %s", dict(prepared.headers))
+        # The CaseInsensitiveDict formats itself; no need to copy it
+        # into a plain dict first
+        log.debug("Headers: %s", prepared.headers)
         if prepared.body:
             body = prepared.body
             if isinstance(body, bytes):
@@ -48,6 +88,8 @@ class NetworkClient:
         self, method: str, url: str, headers: dict, data: Any = None
     ) -> None:
         """Log request details."""
+        if not log.is_debug_enabled():
+            return
         log.debug("--- %s Request ---", method.upper())
         log.debug("URL: %s", url)
         log.debug("Headers:")
@@ -60,28 +102,34 @@ class NetworkClient:
 
         if data:
             if isinstance(data, dict):
-                log.debug("Form Data:")
-                for key, value in data.items():
-                    if isinstance(value, tuple) and len(value) == 2:
-                        # Multipart form data format (filename, content)
-                        filename, content = value
-                        if key in ["password", "signature"]:
-                            log.debug(
-                                "  %s: [HIDDEN - %d chars]",
-                                key,
-                                len(str(content)),
-                            )
-                        else:
-                            log.debug("  %s: %s", key, content)
-                    elif key in ["password", "signature"]:
-                        log.debug("  %s: [HIDDEN]", key)
-                    else:
-                        log.debug("  %s: %s", key, value)
+                self._log_form_data(data)
             else:
                 log.debug("Data: %s", data)
 
+    def _log_form_data(self, data: dict) -> None:
+        """Log form data fields, hiding sensitive values."""
+        log.debug("Form Data:")
+        for key, value in data.items():
+            if isinstance(value, tuple) and len(value) == 2:
+                # Multipart form data format (filename, content)
+                _filename, content = value
+                if key in ["password", "signature"]:
+                    log.debug(
+                        "  %s: [HIDDEN - %d chars]",
+                        key,
+                        len(str(content)),
+                    )
+                else:
+                    log.debug("  %s: %s", key, content)
+            elif key in ["password", "signature"]:
+                log.debug("  %s: [HIDDEN]", key)
+            else:
+                log.debug("  %s: %s", key, value)
+
     def _log_response(self, response) -> None:
         """Log response details."""
+        if not log.is_debug_enabled():
+            return
         if response is None:
             log.debug("No response (dry run or error)")
             return
@@ -92,53 +140,64 @@ class NetworkClient:
         for key, value in response.headers.items():
             log.debug("  %s: %s", key, value)
 
+        # Read the raw bytes once; response.json() followed by a .text
+        # fallback would decode large non-JSON bodies twice (and .text
+        # can trigger charset sniffing)
+        raw = response.content
         try:
-            response_data = response.json()
-            if self.config.pretty_json:
-                log.debug(
-                    "JSON Body:\n%s", json.dumps(response_data, indent=2)
-                )
-            else:
-                log.debug("JSON Body: %s", response_data)
-        except (ValueError, json.JSONDecodeError):
-            log.debug("Text Body: %s", response.text)
+            response_data = _json.loads(raw)
+            log.debug(
+                "JSON Body:\n%s",
+                _LazyJson(response_data, self.config.pretty_json),
+            )
+        except ValueError:
+            log.debug("Text Body: %s", raw.decode("utf-8", errors="replace"))
 
     def _add_default_headers(self, headers: Dict[str, str]) -> None:
         """Add default headers if not present."""
-        if "User-Agent" not in headers:
-            headers["User-Agent"] = self.config.user_agent
-        if "Accept-Encoding" not in headers:
-            headers["Accept-Encoding"] = "gzip, deflate"
-        if "Expect" not in headers:
-            headers["Expect"] = "100-continue"
+        if self._default_headers is None:
+            self._default_headers = {
+                "User-Agent": self.config.user_agent,
+                "Accept-Encoding": "gzip, deflate",
+                "Expect": "100-continue",
+            }
+        for key, value in self._default_headers.items():
+            headers.setdefault(key, value)
 
     def _build_multipart_body(
         self, files: Dict[str, Any]
     ) -> tuple[bytes, str]:
         """Build multipart form data body."""
-        boundary = str(uuid.uuid4())
-        body_parts = []
+        boundary = secrets.token_hex(16)
+
+        # Accumulate straight into a bytearray: the boundary and header
+        # lines are pure ASCII and encoded once, and the field values go
+        # through the UTF-8 codec individually instead of re-encoding
+        # one large joined string at the end
+        boundary_bytes = f"--{boundary}\r\n".encode("ascii")
+        body = bytearray()
 
         for field_name, field_value in files.items():
             if isinstance(field_value, tuple) and len(field_value) == 2:
-                filename, content = field_value
-                value = str(content)
+                _filename, content = field_value
             else:
-                value = str(field_value)
+                content = field_value
+            # Login fields are already strings; only convert the rest
+            value = content if type(content) is str else str(content)
 
             # Match captured format: Content-Type before Content-Disposition
-            part = f"--{boundary}\r\n"
-            part += "Content-Type: text/plain; charset=utf-8\r\n"
-            part += f"Content-Disposition: form-data; name={field_name}\r\n"
-            part += "\r\n"
-            part += f"{value}\r\n"
-            body_parts.append(part)
+            body += boundary_bytes
+            body += b"Content-Type: text/plain; charset=utf-8\r\n"
+            body += (
+                f"Content-Disposition: form-data; name={field_name}\r\n\r\n"
+            ).encode("ascii")
+            body += value.encode("utf-8")
+            body += b"\r\n"
 
         # Add final boundary
-        body_parts.append(f"--{boundary}--\r\n")
-        body = "".join(body_parts).encode("utf-8")
+        body += f"--{boundary}--\r\n".encode("ascii")
 
-        return body, boundary
+        return bytes(body), boundary
 
     def _send_request(self, prepared) -> Optional[requests.Response]:
         """Send a prepared request."""
@@ -146,8 +205,7 @@ class NetworkClient:
             raise RuntimeError("requests library not available")
 
         try:
-            session = requests.Session()
-            response = session.send(
+            response = self._get_session().send(
                 prepared,
                 timeout=self.config.api_timeout,
                 proxies=self.config.proxies if self.config.proxies else None,
@@ -207,7 +265,9 @@ class NetworkClient:
                 method="POST", url=url, data=data, headers=headers
             )
 
-        prepared = req.prepare()
+        # Prepare through the session so its settings merge in one pass
+        # and the prepared request reuses the session's cookie state
+        prepared = self._get_session().prepare_request(req)
 
         if self.config.debug_api_requests:
             self._log_prepared_request(prepared)
@@ -265,7 +325,7 @@ class NetworkClient:
             raise RuntimeError("requests library not available")
 
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 url,
                 params=params,
                 headers=headers,
@@ -314,29 +374,31 @@ class NetworkClient:
 
         log.info("Server response: %d", response.status_code)
 
+        # Read the raw bytes once and parse them directly; response.json()
+        # decodes the body to str first, and falling back to response.text
+        # would decode it a second time on the error path
+        raw = response.content
+
         if response.status_code == 200:
             try:
-                result = response.json()
-                if "result" in result and "token" in result["result"]:
-                    jwt_token = result["result"]["token"]
-                    log.info("Authentication successful")
-                    return jwt_token
-                log.error("Unexpected response format: %s", result)
-                return None
-            except json.JSONDecodeError:
-                log.error("Non-JSON response: %s", response.text)
+                result = _json.loads(raw)
+            except ValueError:
+                log.error("Non-JSON response: %s", raw[:512])
                 return None
-        else:
-            log.error(
-                "Authentication failed with status %d", response.status_code
-            )
-            try:
-                error_data = response.json()
-                log.error("Error details: %s", error_data)
-            except (ValueError, json.JSONDecodeError):
-                log.error("Error response: %s", response.text)
+            if "result" in result and "token" in result["result"]:
+                jwt_token = result["result"]["token"]
+                log.info("Authentication successful")
+                return jwt_token
+            log.error("Unexpected response format: %s", result)
             return None
 
+        log.error("Authentication failed with status %d", response.status_code)
+        try:
+            log.error("Error details: %s", _json.loads(raw))
+        except ValueError:
+            log.error("Error response: %s", raw[:512])
+        return None
+
     def make_authenticated_request(
         self, endpoint: str, jwt_token: str, method: str = "GET", **kwargs
     ) -> Optional[requests.Response]:
@@ -31,22 +31,22 @@ Technical Details:
 """
 
 import base64
+import binascii
 import json
-import sqlite3
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-from Crypto.Cipher import AES
-from Crypto.Hash import SHA1
-from Crypto.Protocol.KDF import PBKDF2
-from Crypto.Random import get_random_bytes
-
-from . import log
+from . import _crypto, db, log
 from .config import get_config
 
 
 def encrypt_paprika_data(
-    plaintext: str, password: str, salt: Optional[bytes] = None
+    plaintext: str,
+    password: str,
+    salt: Optional[bytes] = None,
+    encode_str: bool = True,
 ) -> Tuple[str, bytes]:
     """
     Encrypt data using Paprika's encryption algorithm.
@@ -61,6 +61,8 @@ def encrypt_paprika_data(
         plaintext: The data to encrypt (as string)
         password: The encryption password
         salt: Optional 32-byte salt (if None, generates random salt)
+        encode_str: Return the Base64 output as str (default); pass
+            False to get the Base64 bytes and skip the final decode
 
     Returns:
         Tuple of (Base64-encoded encrypted data, salt used)
@@ -72,54 +74,35 @@ def encrypt_paprika_data(
     """
     # Use provided salt or generate a random 32-byte salt
     if salt is None:
-        salt = get_random_bytes(32)
+        salt = os.urandom(32)
     elif len(salt) != 32:
         raise ValueError(f"Salt must be exactly 32 bytes, got {len(salt)}")
 
-    # Paprika uses exactly 1000 iterations with SHA-1
-    iterations = 1000
-
-    # Derive 48 bytes of key material using PBKDF2-HMAC-SHA1
-    # This matches the .NET Rfc2898DeriveBytes implementation
-    key_iv = PBKDF2(
-        password.encode("utf-8"),
-        salt,
-        dkLen=48,  # Total bytes to derive
-        count=iterations,
-        hmac_hash_module=SHA1,
-    )
-
-    # Split the derived bytes:
-    # - First 32 bytes: AES-256 key
-    # - Next 16 bytes: AES CBC initialization vector
-    key = key_iv[:32]
-    iv = key_iv[32:48]
-
     # Convert plaintext to UTF-8 bytes for encryption
     plaintext_bytes = plaintext.encode("utf-8")
 
-    # Apply PKCS#7 padding
-    # Padding ensures data length is multiple of AES block size
-    block_size = 16
-    padding_length = block_size - (len(plaintext_bytes) % block_size)
-    padding = bytes([padding_length] * padding_length)
-    padded_plaintext = plaintext_bytes + padding
-
-    # Encrypt with AES-256-CBC
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    ciphertext = cipher.encrypt(padded_plaintext)
+    # Derive the key/IV (PBKDF2-HMAC-SHA1, 1000 iterations, matching
+    # the .NET Rfc2898DeriveBytes implementation), apply PKCS#7
+    # padding, and encrypt with AES-256-CBC — all through the shared
+    # OpenSSL-backed primitives
+    ciphertext = _crypto.aes_cbc_pbkdf2_encrypt(
+        plaintext_bytes, _crypto.key_bytes(password), salt
+    )
 
     # Prepend salt to ciphertext (Paprika's format)
     encrypted_data = salt + ciphertext
 
     # Base64 encode for storage
-    encrypted_b64 = base64.b64encode(encrypted_data).decode("utf-8")
-
+    encrypted_b64 = base64.b64encode(encrypted_data)
+    if encode_str:
+        return encrypted_b64.decode("utf-8"), salt
     return encrypted_b64, salt
 
 
 def decrypt_paprika_data(
-    encrypted_b64: str, password: str
+    encrypted_b64: Union[str, bytes],
+    password: str,
+    return_bytes: bool = False,
 ) -> Tuple[str, bytes]:
     """
     Decrypt Paprika-encrypted data.
@@ -132,57 +115,42 @@ def decrypt_paprika_data(
     5. Remove PKCS#7 padding
 
     Args:
-        encrypted_b64: Base64-encoded encrypted data
+        encrypted_b64: Base64-encoded encrypted data (str or bytes)
         password: The decryption password
+        return_bytes: Return the plaintext as raw bytes instead of
+            decoding it to str, for callers that would immediately
+            re-encode it (e.g. to base64)
 
     Returns:
         Tuple of (decrypted plaintext, salt that was used)
 
     Raises:
-        Exception: If decryption fails or padding is invalid
+        ValueError: If decryption fails or padding is invalid
     """
     try:
-        # Decode base64
-        encrypted_data = base64.b64decode(encrypted_b64)
-
-        # Extract salt (first 32 bytes) and ciphertext
-        salt = encrypted_data[:32]
-        ciphertext = encrypted_data[32:]
-
-        # Use exactly 1000 iterations with SHA-1 (Paprika's parameters)
-        iterations = 1000
-
-        # Derive key and IV using PBKDF2 with same parameters as encryption
-        key_iv = PBKDF2(
-            password.encode("utf-8"),
-            salt,
-            dkLen=48,
-            count=iterations,
-            hmac_hash_module=SHA1,
+        # Decode base64 via binascii directly, skipping b64decode's
+        # extra wrapping for this known-good payload
+        encrypted_data = binascii.a2b_base64(encrypted_b64)
+
+        # Extract salt (first 32 bytes) and ciphertext; the ciphertext
+        # stays a zero-copy view of the decoded buffer
+        mv = memoryview(encrypted_data)
+        salt = bytes(mv[: _crypto.SALT_SIZE])
+        ciphertext = mv[_crypto.SALT_SIZE :]
+
+        # Derive the key/IV, decrypt, and strip PKCS#7 padding through
+        # the shared primitives, so this path exercises the exact code
+        # the license decryptor runs (and shares its key-derivation
+        # cache); invalid padding raises ValueError from the unpadder
+        decrypted = _crypto.aes_cbc_pbkdf2_decrypt(
+            ciphertext, _crypto.key_bytes(password), salt
         )
-        key = key_iv[:32]  # AES-256 key
-        iv = key_iv[32:48]  # AES CBC IV
-
-        # Decrypt with AES-256-CBC
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        decrypted_padded = cipher.decrypt(ciphertext)
-
-        # Remove PKCS#7 padding
-        # The last byte indicates the padding length
-        padding_len = decrypted_padded[-1]
-
-        # Validate padding (all padding bytes should equal padding_len)
-        if 1 <= padding_len <= 16:
-            padding_bytes = decrypted_padded[-padding_len:]
-            if all(b == padding_len for b in padding_bytes):
-                decrypted = decrypted_padded[:-padding_len]
-                plaintext = decrypted.decode("utf-8")
-                return plaintext, salt
-
-        raise ValueError("Invalid PKCS#7 padding")
+        if return_bytes:
+            return decrypted, salt
+        return decrypted.decode("utf-8"), salt
 
     except Exception as e:
-        raise Exception(f"Decryption failed: {e}") from e
+        raise ValueError(f"Decryption failed: {e}") from e
 
 
 def read_encrypted_data_from_db(db_path: str) -> Tuple[str, str]:
@@ -201,23 +169,21 @@ def read_encrypted_data_from_db(db_path: str) -> Tuple[str, str]:
     if not Path(db_path).exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute("SELECT product_id, data, signature FROM purchases")
-        row = cursor.fetchone()
+    # Reuse the shared cached read-only connection, so repeated
+    # round-trip runs (and the auth path) don't reopen the database
+    conn = db.get_readonly_connection(db_path)
 
-        if not row:
-            raise Exception("No purchase data found in database")
+    row = conn.execute(
+        "SELECT product_id, data, signature FROM purchases LIMIT 1"
+    ).fetchone()
 
-        product_id, encrypted_data, encrypted_signature = row
-        log.info("Found purchase data for product: %s", product_id)
+    if not row:
+        raise Exception("No purchase data found in database")
 
-        return encrypted_data, encrypted_signature
+    product_id, encrypted_data, encrypted_signature = row
+    log.info("Found purchase data for product: %s", product_id)
 
-    finally:
-        conn.close()
+    return encrypted_data, encrypted_signature
 
 
 def perform_round_trip_test():
@@ -257,13 +223,29 @@ def perform_round_trip_test():
         log.error("Failed to read database: %s", e)
         return False
 
-    # Step 2: Decrypt the data
+    # Step 2: Decrypt the data. The two blobs are independent and the
+    # key derivation releases the GIL inside OpenSSL, so the signature
+    # decryption runs concurrently with the license data decryption.
     log.info("\nStep 2: Decrypting license data...")
 
-    try:
-        decrypted_data, data_salt = decrypt_paprika_data(
-            encrypted_data_original, config.purchase_data_key
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        data_future = pool.submit(
+            decrypt_paprika_data,
+            encrypted_data_original,
+            config.purchase_data_key,
+        )
+        signature_future = pool.submit(
+            decrypt_paprika_data,
+            encrypted_signature_original,
+            config.purchase_signature_key,
         )
+
+        try:
+            decrypted_data, data_salt = data_future.result()
+        except Exception as e:
+            log.error("Failed to decrypt data: %s", e)
+            return False
+
         log.info("Successfully decrypted license data")
 
         # Parse and display license info (partially redacted for privacy)
@@ -283,16 +265,14 @@ def perform_round_trip_test():
             else "N/A",
         )
 
-    except Exception as e:
-        log.error("Failed to decrypt data: %s", e)
-        return False
+        log.info("\nStep 3: Decrypting signature...")
 
-    log.info("\nStep 3: Decrypting signature...")
+        try:
+            decrypted_signature, sig_salt = signature_future.result()
+        except Exception as e:
+            log.error("Failed to decrypt signature: %s", e)
+            return False
 
-    try:
-        decrypted_signature, sig_salt = decrypt_paprika_data(
-            encrypted_signature_original, config.purchase_signature_key
-        )
         log.info("Successfully decrypted signature")
         log.info(
             "  Signature preview: %s...",
@@ -301,10 +281,6 @@ def perform_round_trip_test():
             else decrypted_signature,
         )
 
-    except Exception as e:
-        log.error("Failed to decrypt signature: %s", e)
-        return False
-
     # Step 4: Re-encrypt the data using the same salt
     log.info("\nStep 4: Re-encrypting license data with original salt...")
 
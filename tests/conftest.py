@@ -9,7 +9,9 @@ from pathlib import Path
 
 import pytest
 
+from kappari.auth import Auth
 from kappari.config import get_config
+from kappari.network_client import get_client
 
 
 @pytest.fixture(scope="session")
@@ -18,6 +20,46 @@ def config():
     return get_config()
 
 
+@pytest.fixture(scope="session")
+def shared_client():
+    """Shared network client fixture for all tests."""
+    return get_client()
+
+
+@pytest.fixture(scope="session")
+def auth_instance():
+    """Bare Auth instance shared by tests that don't need decryption.
+
+    Construction wires up the config and network client singletons;
+    one instance per session avoids repeating that setup.
+    """
+    return Auth()
+
+
+@pytest.fixture(scope="session")
+def db_file_exists(config):
+    """Whether the Paprika database file exists, stat'ed once per session."""
+    return Path(config.db_file).exists()
+
+
+@pytest.fixture(scope="session")
+def decrypted_auth(config, db_file_exists):
+    """Auth instance with license data decrypted once per session.
+
+    The 1000-iteration PBKDF2 derivations are the slowest part of the
+    database-backed tests; sharing one decrypted instance runs them a
+    single time for the whole suite.
+    """
+    if not db_file_exists:
+        pytest.skip(
+            f"Skipping: No database found at {config.db_file}. "
+            "Set KAPPARI_DB_FILE or place database at expected location."
+        )
+    auth = Auth()
+    auth.decrypt_license_data()
+    return auth
+
+
 def pytest_configure(config):
     """Configure pytest markers."""
     config.addinivalue_line(
@@ -32,6 +74,10 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_network: test makes actual network requests"
     )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): group tests onto one pytest-xdist worker",
+    )
 
 
 @pytest.fixture
@@ -45,9 +91,9 @@ def _skip_if_no_credentials(config):
 
 
 @pytest.fixture
-def _skip_if_no_database(config):
+def _skip_if_no_database(config, db_file_exists):
     """Skip test if Paprika database file is not available."""
-    if not Path(config.db_file).exists():
+    if not db_file_exists:
         pytest.skip(
             f"Skipping: No database found at {config.db_file}. "
             "Set KAPPARI_DB_FILE or place database at expected location."
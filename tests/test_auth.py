@@ -6,28 +6,20 @@ decryption and API authentication. Tests require valid credentials and
 database.
 """
 
-import json
 import warnings
 
 import pytest
 
-from kappari.auth import Auth
-
 
 @pytest.mark.requires_credentials
 @pytest.mark.requires_database
-def test_full_authentication_flow(
-    _skip_if_no_credentials, _skip_if_no_database
-):
+@pytest.mark.xdist_group("paprika_db")
+def test_full_authentication_flow(_skip_if_no_credentials, decrypted_auth):
     """Test complete authentication flow with real credentials and database."""
-    auth = Auth()
-
-    # Decrypt license data
-    auth.decrypt_license_data()
-
-    # Parse license data to verify it's valid
+    auth = decrypted_auth
 
-    license_json = json.loads(auth.license_data)
+    # License data is parsed once during decryption and cached
+    license_json = auth.license_json
 
     # Should have expected fields
     assert "key" in license_json
@@ -65,18 +57,18 @@ def test_full_authentication_flow(
 
 
 @pytest.mark.requires_database
-def test_auth_class_creation():
+def test_auth_class_creation(auth_instance):
     """Test that Auth class can be instantiated."""
-    auth = Auth()
+    auth = auth_instance
     assert auth is not None
     assert hasattr(auth, "config")
     assert hasattr(auth, "client")
 
 
 @pytest.mark.requires_database
-def test_auth_class_methods():
+def test_auth_class_methods(auth_instance):
     """Test that Auth class has expected methods."""
-    auth = Auth()
+    auth = auth_instance
 
     assert hasattr(auth, "decrypt_license_data")
     assert callable(auth.decrypt_license_data)
@@ -89,20 +81,17 @@ def test_auth_class_methods():
 
 
 @pytest.mark.requires_database
-def test_license_decryption(_skip_if_no_database):
+@pytest.mark.xdist_group("paprika_db")
+def test_license_decryption(decrypted_auth):
     """Test that license data can be decrypted from database."""
-    auth = Auth()
-
-    # This should not raise an exception
-    auth.decrypt_license_data()
+    auth = decrypted_auth
 
     # License data should be populated
     assert auth.license_data is not None
     assert auth.signature is not None
 
-    # License data should be valid JSON
-
-    license_json = json.loads(auth.license_data)
+    # License data should have parsed as JSON during decryption
+    license_json = auth.license_json
     assert isinstance(license_json, dict)
 
     # Should have expected fields
@@ -13,8 +13,16 @@ from kappari.roundtrip import (
     perform_round_trip_test,
 )
 
+# Shared sample inputs, built once at import instead of per test.
+# The salt is 32 ASCII '0' bytes (not NULs), kept for determinism
+# against previously recorded ciphertexts.
+_PT = "test data for encryption"
+_PW = "test password"
+_CUSTOM_SALT = b"0" * 32
+
 
 @pytest.mark.requires_database
+@pytest.mark.xdist_group("paprika_db")
 def test_encryption_roundtrip_verification(_skip_if_no_database):
     """Test encryption round-trip verification with real database."""
 
@@ -29,19 +37,30 @@ def test_encrypt_decrypt_functions_exist():
     assert callable(decrypt_paprika_data)
 
 
-def test_encrypt_decrypt_with_sample_data():
-    """Test encryption/decryption with sample data."""
-    # Test data
-    plaintext = "test data for encryption"
-    password = "test password"
+@pytest.mark.parametrize(
+    ("plaintext", "password", "salt", "exc"),
+    [
+        (_PT, _PW, None, None),
+        (_PT, _PW, b"1" * 32, None),
+        ("test", "password", b"short_salt", ValueError),
+    ],
+)
+def test_encrypt_decrypt_with_sample_data(plaintext, password, salt, exc):
+    """Test encryption/decryption across random, fixed, and bad salts."""
+    if exc is not None:
+        with pytest.raises(exc, match="Salt must be exactly 32 bytes"):
+            encrypt_paprika_data(plaintext, password, salt)
+        return
 
     # Encrypt
-    encrypted_b64, salt = encrypt_paprika_data(plaintext, password)
+    encrypted_b64, used_salt = encrypt_paprika_data(plaintext, password, salt)
 
     # Verify encryption produces expected format
     assert isinstance(encrypted_b64, str)
-    assert isinstance(salt, bytes)
-    assert len(salt) == 32  # Should be 32-byte salt
+    assert isinstance(used_salt, bytes)
+    assert len(used_salt) == 32  # Should be 32-byte salt
+    if salt is not None:
+        assert used_salt == salt
 
     # Decrypt
     decrypted_text, extracted_salt = decrypt_paprika_data(
@@ -50,34 +69,34 @@ def test_encrypt_decrypt_with_sample_data():
 
     # Verify round-trip
     assert decrypted_text == plaintext
-    assert extracted_salt == salt
+    assert extracted_salt == used_salt
 
 
-def test_encrypt_with_custom_salt():
-    """Test encryption with provided salt produces consistent results."""
-    plaintext = "test data"
-    password = "test password"
-    custom_salt = b"0" * 32  # 32 bytes of zeros
+@pytest.fixture(scope="module")
+def custom_salt_encryption():
+    """First encryption with the fixed salt, computed once per module.
+
+    Caching the reference ciphertext means the determinism check below
+    (and any future consumer) only pays for one extra KDF run instead
+    of re-deriving both sides.
+    """
+    return encrypt_paprika_data(_PT, _PW, _CUSTOM_SALT)
 
-    # Encrypt twice with same salt
-    encrypted1, salt1 = encrypt_paprika_data(plaintext, password, custom_salt)
-    encrypted2, salt2 = encrypt_paprika_data(plaintext, password, custom_salt)
+
+def test_encrypt_with_custom_salt(custom_salt_encryption):
+    """Test encryption with provided salt produces consistent results."""
+    encrypted1, salt1 = custom_salt_encryption
+    encrypted2, salt2 = encrypt_paprika_data(_PT, _PW, _CUSTOM_SALT)
 
     # Should produce identical results with same salt
     assert encrypted1 == encrypted2
-    assert salt1 == salt2 == custom_salt
+    assert salt1 == salt2 == _CUSTOM_SALT
 
 
 def test_decrypt_invalid_data():
     """Test that decrypting invalid data raises appropriate errors."""
-    with pytest.raises((ValueError, Exception)):
+    with pytest.raises(ValueError, match="Decryption failed"):
         decrypt_paprika_data("invalid_base64_data", "password")
 
-    with pytest.raises((ValueError, Exception)):
+    with pytest.raises(ValueError, match="Decryption failed"):
         decrypt_paprika_data("", "password")
-
-
-def test_salt_length_validation():
-    """Test that encrypt_paprika_data validates salt length."""
-    with pytest.raises(ValueError, match="Salt must be exactly 32 bytes"):
-        encrypt_paprika_data("test", "password", b"short_salt")